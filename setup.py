@@ -19,5 +19,6 @@ setup(
     description='A simple python client for the VirgoCX API',
     long_description=open('README.md').read(),
     long_description_content_type='text/markdown',
-    url='https://www.github.com/aarjaneiro/vcx_py'
+    url='https://www.github.com/aarjaneiro/vcx_py',
+    extras_require={'async': ['aiohttp'], 'np': ['numpy'], 'fast': ['orjson']}
 )
@@ -8,8 +8,9 @@
 #  SOFTWARE.
 
 from .client import VirgoCXClient
+from .aio import AsyncVirgoCXClient
 from .constants import KLineType, OrderStatus, OrderType, OrderDirection, Enums, STOP_URLLIB_INSECURE_WARN
 from .utils import VirgoCXException
 
-__all__ = ["VirgoCXClient", "VirgoCXException", "KLineType", "OrderStatus", "OrderType", "OrderDirection", "Enums",
-           "STOP_URLLIB_INSECURE_WARN"]
+__all__ = ["VirgoCXClient", "AsyncVirgoCXClient", "VirgoCXException", "KLineType", "OrderStatus", "OrderType",
+           "OrderDirection", "Enums", "STOP_URLLIB_INSECURE_WARN"]
@@ -0,0 +1,181 @@
+#  Copyright (c) 2024 Aaron Janeiro Stone
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+import asyncio
+from typing import Iterable, Optional
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency (pip install vcx-py[async])
+    aiohttp = None
+
+from .constants import ROOT_ADDRESS, VERIFICATION, KLineType, OrderStatus
+from .utils import VirgoCXException, VirgoCXStatusException, VirgoCXAPIError, output_enumify, _json_loads, _md5
+
+
+class AsyncVirgoCXClient:
+    """
+    Asyncio variant of `VirgoCXClient` for overlapping many calls (e.g. querying
+    several symbols at once) over a single pooled connection.
+
+    Requires the optional `aiohttp` dependency. Order placement is only
+    available on the synchronous client.
+    """
+    ENDPOINT = ROOT_ADDRESS  # can be changed for testing
+
+    def __init__(self, api_key: str = None, api_secret: str = None, connection_limit: int = 32):
+        """
+        :param api_key: The API key.
+        :param api_secret: The API secret.
+        :param connection_limit: Maximum number of simultaneous connections to the API host (optional).
+        """
+        if aiohttp is None:
+            raise VirgoCXException("aiohttp is required for AsyncVirgoCXClient "
+                                   "(install with `pip install vcx-py[async]`)")
+
+        # Prevents the api key and secret from being visible as class attributes
+        def _api_key():
+            return api_key
+
+        secret_item = ("apiSecret", str(api_secret))
+
+        def signer(dct: dict):
+            h = _md5()
+            for _, v in sorted([*dct.items(), secret_item]):
+                h.update(str(v).encode())
+            return h.hexdigest()
+
+        self.signer = signer
+        self._api_key = _api_key
+        self._connection_limit = connection_limit
+        self._session = None
+
+    async def __aenter__(self):
+        self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the underlying session and its pooled connections.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _ensure_session(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._connection_limit,
+                                               ssl=None if bool(VERIFICATION) else False))
+
+    async def _request(self, method: str, path: str, typical: bool = True, **kwargs):
+        self._ensure_session()
+        async with self._session.request(method, f"{self.ENDPOINT}{path}", **kwargs) as res:
+            if res.status != 200:
+                raise VirgoCXStatusException(f"Request failed with status code {res.status}: "
+                                             f"{(await res.read())[:512]!r}")
+            res = _json_loads(await res.read())
+            if res["code"] != 0:
+                raise VirgoCXAPIError(f"Request failed with error code {res['code']}: {res}")
+            return output_enumify(res["data"], typical)
+
+    async def kline(self, symbol: str, period: KLineType):
+        """
+        Returns the kline data for a given symbol and period.
+
+        :param symbol: The symbol to query.
+        :param period: How the kline data should be aggregated.
+        """
+        period = int(period)  # IntEnum members pass through unchanged
+        return await self._request("GET", "/market/history/kline", params={"symbol": symbol, "period": period})
+
+    async def klines(self, symbols: Iterable[str], period: KLineType):
+        """
+        Returns the kline data for several symbols concurrently.
+
+        :param symbols: The symbols to query.
+        :param period: How the kline data should be aggregated.
+        """
+        return await asyncio.gather(*(self.kline(s, period) for s in symbols))
+
+    async def ticker(self, symbol: str):
+        """
+        Returns the ticker data for a given symbol.
+
+        :param symbol: The symbol to query.
+        """
+        return await self._request("GET", "/market/detail/merged", params={"symbol": symbol})
+
+    async def tickers(self):
+        """
+        Returns the ticker data for all symbols.
+        """
+        return await self._request("GET", "/market/tickers")
+
+    async def account_info(self):
+        """
+        Returns the account information.
+        """
+        payload = {"apiKey": self._api_key()}
+        payload["sign"] = self.signer(payload)
+        return await self._request("GET", "/member/accounts", params=payload)
+
+    async def query_orders(self, symbol: str, status: Optional[OrderStatus] = None):
+        """
+        Returns user orders for a given symbol and status.
+
+        :param symbol: The symbol to query.
+        :param status: Restrict the query to this specific status (optional).
+        """
+        payload = {"apiKey": self._api_key(), "symbol": symbol}
+        if status is not None:
+            payload["status"] = int(status)
+        payload["sign"] = self.signer(payload)
+        return await self._request("GET", "/member/queryOrder", params=payload)
+
+    async def query_trades(self, symbol: str):
+        """
+        Returns (completed) user trades for a given symbol.
+
+        :param symbol: The symbol to query.
+        """
+        payload = {"apiKey": self._api_key(), "symbol": symbol}
+        payload["sign"] = self.signer(payload)
+        return await self._request("GET", "/member/queryTrade", typical=False, params=payload)
+
+    async def cancel_order(self, order_id: str):
+        """
+        Cancels an order.
+
+        :param order_id: The ID of the order to cancel.
+        """
+        payload = {"apiKey": self._api_key(), "id": order_id}
+        payload["sign"] = self.signer(payload)
+        return await self._request("POST", "/member/cancelOrder", data=payload)
+
+    async def get_discount(self, symbol: Optional[str] = None):
+        """
+        Returns similar output as `ticker` for a given symbol (or all symbols if one is not provided) with
+        your account discount applied to prices.
+
+        Note that this method always returns a list of dictionaries, even if only one symbol is queried.
+
+        :param symbol: The symbol to query (optional).
+        """
+        payload = {"apiKey": self._api_key()}
+        if symbol is not None:
+            payload["symbol"] = symbol
+        payload["sign"] = self.signer(payload)
+        return await self._request("GET", "/member/discountPrice", params=payload)
+
+
+__all__ = ["AsyncVirgoCXClient"]
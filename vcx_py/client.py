@@ -7,15 +7,67 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
+import warnings
+from hashlib import blake2b
 from typing import Optional
 from threading import Lock
+from types import MappingProxyType
 from warnings import warn
 
+import urllib3 as url  # noqa (already comes with requests)
+
 import requests as rq
+from requests.adapters import HTTPAdapter
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency (pip install vcx-py[np])
+    np = None
 
-from .constants import ROOT_ADDRESS, VERIFICATION, KLineType, OrderStatus, \
+from .constants import ROOT_ADDRESS, VERIFICATION, STOP_URLLIB_INSECURE_WARN, KLineType, OrderStatus, \
     OrderType, OrderDirection
-from .utils import VirgoCXWarning, VirgoCXException, vcx_sign, result_formatter, maybe_suppress_insecure
+from .utils import VirgoCXWarning, VirgoCXException, result_formatter, _md5
+
+
+_API_PATHS = {
+    "kline": "/market/history/kline",
+    "ticker": "/market/detail/merged",
+    "tickers": "/market/tickers",
+    "accounts": "/member/accounts",
+    "query_order": "/member/queryOrder",
+    "query_trade": "/member/queryTrade",
+    "add_order": "/member/addOrder",
+    "cancel_order": "/member/cancelOrder",
+    "discount_price": "/member/discountPrice",
+}
+"""Endpoint paths, joined with `ENDPOINT` once per client instead of per call."""
+
+
+_WARN_FILTERS_INSTALLED = False
+
+
+def _install_warning_filters():
+    """
+    One-time warning-filter setup: disables the urllib3 InsecureRequestWarning
+    when `STOP_URLLIB_INSECURE_WARN` is set (far cheaper than catching it per
+    call) and deduplicates repeated `VirgoCXWarning` emissions.
+    """
+    global _WARN_FILTERS_INSTALLED
+    if _WARN_FILTERS_INSTALLED:
+        return
+    if STOP_URLLIB_INSECURE_WARN:
+        url.disable_warnings(url.exceptions.InsecureRequestWarning)
+    warnings.filterwarnings("once", category=VirgoCXWarning)
+    _WARN_FILTERS_INSTALLED = True
+
+
+def _too_many_decimals(x: float, n: int) -> bool:
+    """
+    Arithmetic check for whether `x` has more than `n` decimal places,
+    avoiding the allocations of a str/split round trip.
+    """
+    scaled = x * (10 ** n)
+    return abs(scaled - round(scaled)) > 1e-9
 
 
 class VirgoCXClient:
@@ -26,25 +78,122 @@ class VirgoCXClient:
     STATIC_LOCK = Lock()  # in case of multithreading, locks the formatting cache
     ENDPOINT = ROOT_ADDRESS  # can be changed for testing
 
-    def __init__(self, api_key: str = None, api_secret: str = None):
+    def __init__(self, api_key: str = None, api_secret: str = None,
+                 pool_maxsize: int = 32, pool_block: bool = False,
+                 signature_algo: str = "md5"):
+        """
+        :param api_key: The API key.
+        :param api_secret: The API secret.
+        :param pool_maxsize: Maximum number of pooled connections kept to the API host (optional).
+        :param pool_block: Whether to block (rather than open extra connections) when the pool is
+                           exhausted (optional).
+        :param signature_algo: Hash used to sign requests, either "md5" or "blake2b" (optional).
+                               Leave as "md5" unless the API is known to accept blake2b signatures.
+        """
         # Prevents the api key and secret from being visible as class attributes
         def _api_key():
             return api_key
 
-        def signer(dct: dict):
-            return vcx_sign(dct, api_secret)
+        # The secret is stringified and placed in its sorted key position once
+        # here rather than on every signing call.
+        secret_item = ("apiSecret", str(api_secret))
+
+        if signature_algo == "md5":
+            hasher = _md5
+        elif signature_algo == "blake2b":
+            def hasher():
+                return blake2b(digest_size=16)
+        else:
+            raise ValueError(f"Unknown signature algorithm: {signature_algo}")
+
+        # `_str`/`_sorted` default-arg bindings turn global lookups into local
+        # loads inside the per-call closures
+        # Joining the encoded parts and hashing once keeps the hot region a
+        # single C call instead of one update per value
+        def signer(dct: dict, _str=str, _sorted=sorted):
+            h = hasher()
+            h.update(b"".join(_str(v).encode() for _, v in _sorted([*dct.items(), secret_item])))
+            return h.hexdigest()
+
+        secret_bytes = secret_item[1].encode()
+
+        def signer_ordered(dct: dict, _str=str):
+            # Assumes the payload keys were inserted in sorted order, which
+            # lets the per-call sort in `signer` be skipped entirely.
+            parts = []
+            secret_placed = False
+            for k, v in dct.items():
+                if not secret_placed and k > "apiSecret":
+                    parts.append(secret_bytes)
+                    secret_placed = True
+                parts.append(_str(v).encode())
+            if not secret_placed:
+                parts.append(secret_bytes)
+            h = hasher()
+            h.update(b"".join(parts))
+            return h.hexdigest()
 
         self.signer = signer
+        self.signer_ordered = signer_ordered
         self._api_key = _api_key
 
-        with VirgoCXClient.STATIC_LOCK:
-            if VirgoCXClient.FMT_DATA is None:
-                VirgoCXClient.FMT_DATA = {v["symbol"]: {"price_decimals": v["priceDecimals"],
-                                                        "qty_decimals": v["qtyDecimals"],
-                                                        "min_total": v["minTotal"]} for v in
-                                          self.tickers()}
+        # A persistent session keeps the TCP/TLS connection alive across calls
+        # instead of redoing the handshake on every request.
+        self._session = rq.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize,
+                                                    pool_block=pool_block, max_retries=0))
+        self._session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+        self.refresh_verification()
+
+        _install_warning_filters()
+
+        # Full URLs are fixed once ENDPOINT is known, so build them here rather
+        # than interpolating an f-string on every call
+        self._urls = {name: self.ENDPOINT + path for name, path in _API_PATHS.items()}
+
+        # `tickers` takes no parameters, so its request can be prepared once
+        # and re-sent, skipping per-call request construction
+        self._tickers_prepared = self._session.prepare_request(rq.Request("GET", self._urls["tickers"]))
+
+    def _ensure_fmt_data(self):
+        """
+        Populates the shared symbol formatting cache on first use. Fetching it
+        lazily keeps construction free of an API round-trip for read-only
+        workloads that never place an order.
+
+        Double-checked locking: FMT_DATA is written exactly once (as a
+        read-only proxy assigned in a single dict swap), so readers never
+        need the lock afterwards.
+        """
+        if VirgoCXClient.FMT_DATA is None:
+            with VirgoCXClient.STATIC_LOCK:
+                if VirgoCXClient.FMT_DATA is None:
+                    VirgoCXClient.FMT_DATA = MappingProxyType(
+                        {v["symbol"]: {"price_decimals": v["priceDecimals"],
+                                       "qty_decimals": v["qtyDecimals"],
+                                       "min_total": v["minTotal"]} for v in
+                         self.tickers()})
+
+    def refresh_verification(self):
+        """
+        Re-reads the `VERIFICATION` flag into the underlying session.
+
+        Call this if the flag is toggled after the client has been constructed.
+        """
+        self._session.verify = bool(VERIFICATION)
+
+    def close(self):
+        """
+        Closes the underlying session and its pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
-    @maybe_suppress_insecure
     @result_formatter()
     def kline(self, symbol: str, period: KLineType):
         """
@@ -53,12 +202,10 @@ class VirgoCXClient:
         :param symbol: The symbol to query.
         :param period: How the kline data should be aggregated.
         """
-        if isinstance(period, KLineType):
-            period = period.value
-        return rq.get(f"{self.ENDPOINT}/market/history/kline", params={"symbol": symbol, "period": period},
-                      verify=VERIFICATION)
+        period = int(period)  # IntEnum members pass through unchanged
+        return self._session.get(self._urls["kline"],
+                                 params={"symbol": symbol, "period": period})
 
-    @maybe_suppress_insecure
     @result_formatter()
     def ticker(self, symbol: str):
         """
@@ -66,27 +213,44 @@ class VirgoCXClient:
 
         :param symbol: The symbol to query.
         """
-        return rq.get(f"{self.ENDPOINT}/market/detail/merged", params={"symbol": symbol}, verify=VERIFICATION)
+        return self._session.get(self._urls["ticker"], params={"symbol": symbol})
 
-    @maybe_suppress_insecure
     @result_formatter()
     def tickers(self):
         """
         Returns the ticker data for all symbols.
         """
-        return rq.get(f"{self.ENDPOINT}/market/tickers", verify=VERIFICATION)
+        return self._session.send(self._tickers_prepared)
+
+    def tickers_np(self, fields: tuple = ("last", "bid", "ask", "vol")):
+        """
+        Returns the ticker data for all symbols as a structured NumPy array
+        with a `symbol` column plus one float64 column per requested field,
+        for consumers who only want the numbers. Fields absent from a row are
+        filled with NaN.
+
+        Requires the optional `numpy` dependency.
+
+        :param fields: The numeric response fields to extract (optional).
+        """
+        if np is None:
+            raise VirgoCXException("numpy is required for tickers_np "
+                                   "(install with `pip install vcx-py[np]`)")
+        rows = self.tickers()
+        out = np.empty(len(rows), dtype=[("symbol", "U16")] + [(f, "f8") for f in fields])
+        for i, row in enumerate(rows):
+            out[i] = (row.get("symbol", ""),) + tuple(float(row[f]) if f in row else np.nan for f in fields)
+        return out
 
-    @maybe_suppress_insecure
     @result_formatter()
     def account_info(self):
         """
         Returns the account information.
         """
         payload = {"apiKey": self._api_key()}
-        payload["sign"] = self.signer(payload)
-        return rq.get(f"{self.ENDPOINT}/member/accounts", params=payload, verify=VERIFICATION)
+        payload["sign"] = self.signer_ordered(payload)
+        return self._session.get(self._urls["accounts"], params=payload)
 
-    @maybe_suppress_insecure
     @result_formatter()
     def query_orders(self, symbol: str, status: Optional[OrderStatus] = None):
         """
@@ -95,15 +259,14 @@ class VirgoCXClient:
         :param symbol: The symbol to query.
         :param status: Restrict the query to this specific status (optional).
         """
-        payload = {"apiKey": self._api_key(), "symbol": symbol}
+        # Keys inserted in sorted order for the ordered signing fast path
+        payload = {"apiKey": self._api_key()}
         if status is not None:
-            if isinstance(status, OrderStatus):
-                status = status.value
-            payload["status"] = status
-        payload["sign"] = self.signer(payload)
-        return rq.get(f"{self.ENDPOINT}/member/queryOrder", params=payload, verify=VERIFICATION)
+            payload["status"] = int(status)
+        payload["symbol"] = symbol
+        payload["sign"] = self.signer_ordered(payload)
+        return self._session.get(self._urls["query_order"], params=payload)
 
-    @maybe_suppress_insecure
     @result_formatter(False)
     def query_trades(self, symbol: str):
         """
@@ -112,10 +275,9 @@ class VirgoCXClient:
         :param symbol: The symbol to query.
         """
         payload = {"apiKey": self._api_key(), "symbol": symbol}
-        payload["sign"] = self.signer(payload)
-        return rq.get(f"{self.ENDPOINT}/member/queryTrade", params=payload, verify=VERIFICATION)
+        payload["sign"] = self.signer_ordered(payload)
+        return self._session.get(self._urls["query_trade"], params=payload)
 
-    @maybe_suppress_insecure
     @result_formatter()
     def place_order(self, symbol: str, category: OrderType, direction: OrderDirection,
                     price: Optional[float] = None, qty: Optional[float] = None,
@@ -136,10 +298,8 @@ class VirgoCXClient:
         Note that without `handle_conversions`, `price` is required for limit orders and `total` is required for
         non-limit buy orders (otherwise `qty` is required).
         """
-        if isinstance(category, OrderType):
-            category = category.value
-        if isinstance(direction, OrderDirection):
-            direction = direction.value
+        category = int(category)  # IntEnum members pass through unchanged
+        direction = int(direction)
 
         # Handle conversions
         if category == OrderType.LIMIT:
@@ -172,45 +332,100 @@ class VirgoCXClient:
                     qty = total / market_price
                     total = None
 
-        payload = {"apiKey": self._api_key(), "symbol": symbol, "category": category, "type": direction,
-                   "country": 1}
+        payload = self._build_order_payload(symbol, category, direction, price, qty, total)
+        return self._session.post(self._urls["add_order"], data=payload)
 
-        with VirgoCXClient.STATIC_LOCK:
-            if symbol in VirgoCXClient.FMT_DATA:
-                fmt_data = VirgoCXClient.FMT_DATA[symbol]
-            else:
-                raise VirgoCXException(f"Symbol {symbol} not found in formatting cache")
+    def _build_order_payload(self, symbol: str, category: int, direction: int,
+                             price: Optional[float], qty: Optional[float],
+                             total: Optional[float]) -> dict:
+        """
+        Formats, validates, assembles and signs an order payload. Expects
+        `category` and `direction` to already be plain ints.
+        """
+        self._ensure_fmt_data()
+
+        # FMT_DATA is immutable once populated, so no lock is needed to read it
+        fmt_data = VirgoCXClient.FMT_DATA.get(symbol)
+        if fmt_data is None:
+            raise VirgoCXException(f"Symbol {symbol} not found in formatting cache")
 
         # Format and check values
         if price is not None:
-            price = float(price)  # can be int which breaks decimal places check
-            if len(str(price).split(".")[1]) > fmt_data["price_decimals"]:
+            price = float(price)
+            if _too_many_decimals(price, fmt_data["price_decimals"]):
                 warn(f"Price {price} has more than {fmt_data['price_decimals']} decimal places. Correcting...",
                      VirgoCXWarning)
                 price = round(price, fmt_data["price_decimals"])
-            payload["price"] = price
 
         if qty is not None:
             qty = float(qty)
-            if len(str(qty).split(".")[1]) > fmt_data["qty_decimals"]:
+            if _too_many_decimals(qty, fmt_data["qty_decimals"]):
                 warn(f"Quantity {qty} has more than {fmt_data['qty_decimals']} decimal places. Correcting...",
                      VirgoCXWarning)
                 qty = round(qty, fmt_data["qty_decimals"])
-            payload["qty"] = qty
 
         if total is not None:
             total = float(total)
             if total < fmt_data["min_total"]:
                 raise ValueError(f"Total {total} is below the minimum allowed {fmt_data['min_total']}")
-            if len(str(total).split(".")[1]) > fmt_data["price_decimals"]:
+            if _too_many_decimals(total, fmt_data["price_decimals"]):
                 warn(f"Total {total} has more than {fmt_data['price_decimals']} decimal places. Correcting...",
                      VirgoCXWarning)
                 total = round(total, fmt_data["price_decimals"])
+
+        # Keys inserted in sorted order for the ordered signing fast path
+        payload = {"apiKey": self._api_key(), "category": category, "country": 1}
+        if price is not None:
+            payload["price"] = price
+        if qty is not None:
+            payload["qty"] = qty
+        payload["symbol"] = symbol
+        if total is not None:
             payload["total"] = total
+        payload["type"] = direction
 
-        # Sign and send request
-        payload["sign"] = self.signer(payload)
-        return rq.post(f"{self.ENDPOINT}/member/addOrder", data=payload, verify=VERIFICATION)
+        payload["sign"] = self.signer_ordered(payload)
+        return payload
+
+    @result_formatter()
+    def place_limit_order(self, symbol: str, direction: OrderDirection, price: float, qty: float):
+        """
+        Fast path for placing a limit order with an explicit price and quantity,
+        skipping the conversion handling in `place_order`.
+
+        :param symbol: The symbol to place the order for.
+        :param direction: The direction of the order.
+        :param price: The price of the order.
+        :param qty: The quantity of the order in terms of the cryptocurrency.
+        """
+        payload = self._build_order_payload(symbol, int(OrderType.LIMIT), int(direction), price, qty, None)
+        return self._session.post(self._urls["add_order"], data=payload)
+
+    @result_formatter()
+    def place_market_buy(self, symbol: str, total: float):
+        """
+        Fast path for placing a market buy with an explicit total, skipping the
+        conversion handling in `place_order`.
+
+        :param symbol: The symbol to place the order for.
+        :param total: The total value of the order in terms of the fiat currency.
+        """
+        payload = self._build_order_payload(symbol, int(OrderType.MARKET), int(OrderDirection.BUY),
+                                            None, None, total)
+        return self._session.post(self._urls["add_order"], data=payload)
+
+    @result_formatter()
+    def place_market_sell(self, symbol: str, qty: float):
+        """
+        Fast path for placing a market sell with an explicit quantity, skipping
+        the conversion handling in `place_order`.
+
+        :param symbol: The symbol to place the order for.
+        :param qty: The quantity of the order in terms of the cryptocurrency.
+        """
+        payload = self._build_order_payload(symbol, int(OrderType.MARKET), int(OrderDirection.SELL),
+                                            None, qty, None)
+        return self._session.post(self._urls["add_order"], data=payload)
 
     def __extract_market_price__(self, direction, symbol):
         market_price = self.get_discount(symbol=symbol)[0]
@@ -220,7 +435,6 @@ class VirgoCXClient:
             market_price = float(market_price["Bid"])
         return market_price
 
-    @maybe_suppress_insecure
     @result_formatter()
     def cancel_order(self, order_id: str):
         """
@@ -229,10 +443,9 @@ class VirgoCXClient:
         :param order_id: The ID of the order to cancel.
         """
         payload = {"apiKey": self._api_key(), "id": order_id}
-        payload["sign"] = self.signer(payload)
-        return rq.post(f"{self.ENDPOINT}/member/cancelOrder", data=payload, verify=VERIFICATION)
+        payload["sign"] = self.signer_ordered(payload)
+        return self._session.post(self._urls["cancel_order"], data=payload)
 
-    @maybe_suppress_insecure
     @result_formatter()
     def get_discount(self, symbol: Optional[str] = None):
         """
@@ -246,5 +459,5 @@ class VirgoCXClient:
         payload = {"apiKey": self._api_key()}
         if symbol is not None:
             payload["symbol"] = symbol
-        payload["sign"] = self.signer(payload)
-        return rq.get(f"{self.ENDPOINT}/member/discountPrice", params=payload, verify=VERIFICATION)
+        payload["sign"] = self.signer_ordered(payload)
+        return self._session.get(self._urls["discount_price"], params=payload)
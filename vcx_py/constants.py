@@ -8,10 +8,12 @@
 #  SOFTWARE.
 
 from enum import IntEnum
+from sys import intern
 
 
 class _Flag:
     """A simple flag class."""
+    __slots__ = ("_value",)  # keeps __bool__'s attribute load off an instance dict
 
     def __init__(self, value):
         self._value = value
@@ -45,7 +47,20 @@ Use the `.set()` method to activate this feature.
 """
 
 
-class KLineType(IntEnum):
+class _FastIntEnum(IntEnum):
+    """
+    `IntEnum` with an O(1) member lookup that bypasses `EnumMeta.__call__`.
+    """
+
+    @classmethod
+    def from_value(cls, v):
+        """
+        Cheap alternative to `cls(v)`; unknown values are returned unchanged.
+        """
+        return cls._value2member_map_.get(v, v)
+
+
+class KLineType(_FastIntEnum):
     """
     Enum for the type of kline.
     """
@@ -61,7 +76,7 @@ class KLineType(IntEnum):
     MONTH = 43200
 
 
-class OrderStatus(IntEnum):
+class OrderStatus(_FastIntEnum):
     """
     Enum for the status of an order.
     """
@@ -72,7 +87,7 @@ class OrderStatus(IntEnum):
     COMPLETED = 3
 
 
-class OrderDirection(IntEnum):
+class OrderDirection(_FastIntEnum):
     """
     Enum for the direction of an order.
     """
@@ -81,14 +96,15 @@ class OrderDirection(IntEnum):
 
     @classmethod
     def from_str(cls, s: str):
-        if s.lower() == "buy":
-            return cls.BUY
-        elif s.lower() == "sell":
-            return cls.SELL
-        raise ValueError(f"Invalid order direction: {s}")
+        # Common spellings hit the table directly, avoiding the .lower()
+        # allocation on the happy path
+        m = _DIRECTION_FROM_STR.get(s) or _DIRECTION_FROM_STR.get(s.lower())
+        if m is None:
+            raise ValueError(f"Invalid order direction: {s}")
+        return m
 
 
-class OrderType(IntEnum):
+class OrderType(_FastIntEnum):
     """
     Enum for the type of an order.
     """
@@ -97,25 +113,52 @@ class OrderType(IntEnum):
     QUICK_TRADE = 3
 
 
+def _value_map(enum_cls) -> dict:
+    """
+    Precomputed value-to-member table for `enum_cls`; a plain dict probe is
+    several times faster than `EnumMeta.__call__` per converted value.
+    """
+    return {m.value: m for m in enum_cls}
+
+
+_DIRECTION_FROM_STR = {s: m for m in OrderDirection
+                       for s in (m.name.lower(), m.name, m.name.capitalize())}
+"""Common spellings of order directions, mapped to members."""
+
 TYPICAL_KEY_TO_ENUM = {
-    "status": OrderStatus,
-    "direction": OrderDirection,
-    "type": OrderType
+    "status": _value_map(OrderStatus),
+    "direction": _value_map(OrderDirection),
+    "type": _value_map(OrderType)
 }
 """
-Mapping of keys to enums in the typical case.
+Mapping of keys to value-to-member tables in the typical case.
+Unknown values pass through unconverted.
 """
 
 ATYPICAL_KEY_TO_ENUM = {
-    "status": OrderStatus,
-    "category": OrderType,
-    "type": OrderDirection.from_str
+    "status": _value_map(OrderStatus),
+    "category": _value_map(OrderType),
+    "type": _DIRECTION_FROM_STR
 }
 """
-Mapping of keys to enums in the atypical case.
+Mapping of keys to value-to-member tables in the atypical case.
+Unknown values pass through unconverted.
 """
 
 
+# Interned keys share identity with the (also interned) object keys produced
+# by the JSON decoder, letting dict probes hit the identity fast path instead
+# of comparing characters.
+TYPICAL_KEY_TO_ENUM = {intern(k): v for k, v in TYPICAL_KEY_TO_ENUM.items()}
+ATYPICAL_KEY_TO_ENUM = {intern(k): v for k, v in ATYPICAL_KEY_TO_ENUM.items()}
+
+TYPICAL_ENUM_PAIRS = tuple(TYPICAL_KEY_TO_ENUM.items())
+"""`TYPICAL_KEY_TO_ENUM` flattened to pairs for cheap iteration."""
+
+ATYPICAL_ENUM_PAIRS = tuple(ATYPICAL_KEY_TO_ENUM.items())
+"""`ATYPICAL_KEY_TO_ENUM` flattened to pairs for cheap iteration."""
+
+
 class Enums:
     """
     VirgoCX API enums.